@@ -6,13 +6,212 @@ This module provides functionality to create invitations in batches
 with various configuration options.
 """
 
-import argparse
-import json
+import logging
 import sys
-from typing import Dict, List, Optional, Any
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Any
+
+# The HTTP libraries, asyncio, argparse and json are imported where they are
+# used: requests and aiohttp alone take well over 100ms to import, which
+# dominates short invocations such as --help or single invitations.
+
+try:
+    import orjson
+except ImportError:  # optional, faster JSON encoding
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# CLI batches larger than this are written out record by record as they are
+# created; smaller ones are collected and written with a single call
+STREAM_THRESHOLD = 1000
+
+# Settings a --config file may provide; anything else in it is ignored
+CONFIG_KEYS = (
+    'count',
+    'server_ids',
+    'expires_in_days',
+    'duration',
+    'unlimited',
+    'library_ids',
+    'allow_downloads',
+    'allow_live_tv',
+    'allow_mobile_uploads',
+)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize ``obj`` to compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    import json
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _loads(data: bytes) -> Any:
+    """Deserialize JSON from UTF-8 bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    import json
+    return json.loads(data)
+
+
+def _run_async(coro: Any) -> Any:
+    """Run ``coro`` to completion, on uvloop's event loop when installed."""
+    import asyncio
+    try:
+        import uvloop
+    except ImportError:  # optional, faster event loop
+        return asyncio.run(coro)
+    
+    if hasattr(uvloop, 'run'):
+        return uvloop.run(coro)
+    uvloop.install()
+    return asyncio.run(coro)
+
+
+def _invitation_url(data: Dict[str, Any]) -> Optional[str]:
+    """Return the URL from an invitation response, if it has one."""
+    return (data.get("invitation") or {}).get("url")
+
+
+@dataclass
+class InviteResult:
+    """A successfully created invitation within a batch.
+    
+    Attributes:
+        index: Position of the invitation in the batch, starting at 1
+        url: Invitation URL, if the response contained one
+        raw: Full API response, or None when only the URL was kept
+    """
+    
+    __slots__ = ('index', 'url', 'raw')
+    
+    index: int
+    url: Optional[str]
+    raw: Optional[Dict[str, Any]]
+    
+    @classmethod
+    def from_response(
+        cls,
+        index: int,
+        data: Dict[str, Any],
+        url_only: bool = False
+    ) -> "InviteResult":
+        """Build a result from an invitation response."""
+        url = _invitation_url(data)
+        return cls(index, url, None if url_only else data)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the JSON form used in verbose output."""
+        return {
+            "success": True,
+            "index": self.index,
+            "url": self.url,
+            "data": self.raw
+        }
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    """Return the HTTP status of a failed request, if it got a response."""
+    # aiohttp exposes it on the error, requests and httpx on error.response
+    status = getattr(error, "status", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status
+
+
+def _bulk_unsupported(error: Exception) -> bool:
+    """Whether a bulk request failed because the server lacks the endpoint.
+    
+    Servers without ``/api/invitations/batch`` answer with a client error
+    (404, 405, or a validation error when "batch" is routed as an ID);
+    rate limiting is not taken as a sign of missing support.
+    """
+    status = _status_code(error)
+    return status is not None and 400 <= status < 500 and status != 429
+
+
+def _bulk_fallback(error: Exception) -> bool:
+    """Whether a failed bulk request can be replaced by per-item requests.
+    
+    An error status means the server rejected the request, or did not
+    route it to a bulk endpoint at all (stock Wizarr may treat "batch" as
+    an invitation ID and fail with a 5xx). Without a response the batch may
+    still have been created, so falling back could duplicate it.
+    """
+    return _status_code(error) is not None
+
+
+def _bulk_invitations(data: Any) -> List[Dict[str, Any]]:
+    """Extract the invitation list from a bulk endpoint response.
+    
+    Raises:
+        ValueError: If the response is neither a list nor a dictionary with
+            an "invitations" list; it is included in the message, as it may
+            describe invitations that were created
+    """
+    invitations = data.get("invitations") if isinstance(data, dict) else data
+    if not isinstance(invitations, list):
+        raise ValueError(f"Unexpected bulk response: {_dumps(data).decode('utf-8')}")
+    return invitations
+
+
+def _batch_summary(
+    count: int,
+    results: List[InviteResult],
+    errors: List[Dict[str, Any]],
+    successful: int
+) -> Dict[str, Any]:
+    """Build the structure returned by the batch methods."""
+    return {
+        "results": results,
+        "errors": errors,
+        "total": count,
+        "successful": successful,
+        "failed": len(errors)
+    }
+
+
+def _bulk_summary(
+    count: int,
+    invitations: List[Dict[str, Any]],
+    url_only: bool = False,
+    on_result: Optional[Callable[[InviteResult], None]] = None
+) -> Dict[str, Any]:
+    """Build a batch summary from a bulk endpoint's invitation list."""
+    invitations = invitations[:count]
+    results = []
+    for i, invitation in enumerate(invitations):
+        result = InviteResult.from_response(i + 1, {"invitation": invitation}, url_only)
+        if on_result is None:
+            results.append(result)
+        else:
+            on_result(result)
+    errors = [
+        {
+            "success": False,
+            "index": i + 1,
+            "error": "Invitation missing from bulk response"
+        }
+        for i in range(len(invitations), count)
+    ]
+    logger.info("✓ Created %d/%d invitation(s) in one request", len(invitations), count)
+    return _batch_summary(count, results, errors, len(invitations))
+
+
+def _failed_summary(count: int, error: Exception) -> Dict[str, Any]:
+    """Build a batch summary where every invitation failed with ``error``."""
+    logger.error("✗ Failed to create %d invitation(s): %s", count, error)
+    errors = [
+        {
+            "success": False,
+            "index": i + 1,
+            "error": str(error)
+        }
+        for i in range(count)
+    ]
+    return _batch_summary(count, [], errors, 0)
 
 
 class WizarrClient:
@@ -21,35 +220,118 @@ class WizarrClient:
     Args:
         base_url: Base URL of the Wizarr API (default: https://invite.rarbg.zip)
         api_key: API key for authentication
+        pool_maxsize: Maximum number of pooled keep-alive connections per host
+        max_workers: Number of threads create_invitations_batch runs
+            requests on
+        try_bulk: Whether batches try the bulk endpoint first; pass False
+            for servers known to lack it to save a round trip per batch
     """
     
-    def __init__(self, base_url: str = "https://invite.rarbg.zip", api_key: str = None):
+    def __init__(
+        self,
+        base_url: str = "https://invite.rarbg.zip",
+        api_key: str = None,
+        pool_maxsize: int = 50,
+        max_workers: int = 20,
+        try_bulk: bool = True
+    ):
+        from concurrent.futures import ThreadPoolExecutor
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
         # Add https:// scheme if not provided
         if not base_url.startswith(('http://', 'https://')):
             base_url = f'https://{base_url}'
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
         self.session = requests.Session()
+        # Whether the server has the bulk endpoint; None until first tried
+        self._bulk_supported: Optional[bool] = None if try_bulk else False
+        # Shared by every batch so worker threads are spawned only once
+        self._max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix='wizarr'
+        )
         
-        # Configure retry strategy
+        # Configure retry strategy. urllib3 skips POST by default, which
+        # would leave invitation creation without retries; retrying it is
+        # acceptable because a duplicate is just one more unused invitation.
+        # Error responses get a few quick retries and waits are capped, so a
+        # server that keeps failing is given up on within seconds.
         retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
+            total=10,
+            connect=5,
+            status=3,
+            backoff_factor=0.3,
+            backoff_max=5,
             status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(['GET', 'POST']),
+            respect_retry_after_header=True,
+        )
+        # Size the pool for concurrent batches so overflow requests don't
+        # discard connections and pay a fresh TCP/TLS handshake
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=20,
+            pool_maxsize=pool_maxsize,
+            pool_block=False
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
         
+        # A retried bulk request could create the whole batch again, so it
+        # is only retried when the connection could not be established
+        bulk_adapter = HTTPAdapter(
+            max_retries=Retry(
+                total=5,
+                connect=5,
+                read=0,
+                status=0,
+                backoff_factor=0.3,
+                allowed_methods=frozenset(['POST']),
+            ),
+            pool_connections=1,
+            pool_maxsize=1,
+            pool_block=False
+        )
+        self.session.mount(f"{self.base_url}/api/invitations/batch", bulk_adapter)
+        
         # Set default headers
+        self.session.headers['Connection'] = 'keep-alive'
         if self.api_key:
             self.session.headers.update({
                 'X-API-Key': self.api_key,
                 'Content-Type': 'application/json'
             })
     
-    def create_invitation(
-        self,
+    def close(self) -> None:
+        """Stop the worker threads and release pooled connections.
+        
+        Requests still queued on the worker threads are dropped.
+        """
+        if sys.version_info >= (3, 9):
+            self._executor.shutdown(cancel_futures=True)
+        else:
+            self._executor.shutdown()
+        self.session.close()
+    
+    def __enter__(self) -> "WizarrClient":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+    
+    @classmethod
+    def build_payload(
+        cls,
         server_ids: List[int],
         expires_in_days: Optional[int] = None,
         duration: str = "unlimited",
@@ -59,7 +341,7 @@ class WizarrClient:
         allow_live_tv: bool = False,
         allow_mobile_uploads: bool = False
     ) -> Dict[str, Any]:
-        """Create a single invitation.
+        """Build the request body for the invitation endpoints.
         
         Args:
             server_ids: Array of server IDs (required)
@@ -72,13 +354,8 @@ class WizarrClient:
             allow_mobile_uploads: Allow mobile uploads
             
         Returns:
-            Dictionary containing the invitation response
-            
-        Raises:
-            requests.exceptions.RequestException: If the API request fails
+            Dictionary to send as the JSON request body
         """
-        url = f"{self.base_url}/api/invitations"
-        
         payload = {
             "server_ids": server_ids,
             "duration": duration,
@@ -95,10 +372,112 @@ class WizarrClient:
         if library_ids is not None:
             payload["library_ids"] = library_ids
         
+        return payload
+    
+    def _post_invitation(self, payload_bytes: bytes) -> Dict[str, Any]:
+        """POST a serialized invitation body and decode the response.
+        
+        Raises:
+            requests.exceptions.RequestException: If the API request fails
+        """
+        response = self.session.post(
+            f"{self.base_url}/api/invitations",
+            data=payload_bytes,
+            headers={'Content-Type': 'application/json'}
+        )
+        response.raise_for_status()
+        
+        return _loads(response.content)
+    
+    def create_invitation(
+        self,
+        server_ids: List[int],
+        expires_in_days: Optional[int] = None,
+        duration: str = "unlimited",
+        unlimited: bool = True,
+        library_ids: Optional[List[int]] = None,
+        allow_downloads: bool = False,
+        allow_live_tv: bool = False,
+        allow_mobile_uploads: bool = False,
+        url_only: bool = False
+    ) -> Dict[str, Any]:
+        """Create a single invitation.
+        
+        Args:
+            server_ids: Array of server IDs (required)
+            expires_in_days: Days until invitation expires (1, 7, 30, or None)
+            duration: User access duration in days or "unlimited"
+            unlimited: Whether user access is unlimited
+            library_ids: Array of library IDs to grant access to
+            allow_downloads: Allow user downloads
+            allow_live_tv: Allow live TV access
+            allow_mobile_uploads: Allow mobile uploads
+            url_only: Return only ``{"invitation": {"url": ...}}`` instead of
+                the full response
+            
+        Returns:
+            Dictionary containing the invitation response
+            
+        Raises:
+            requests.exceptions.RequestException: If the API request fails
+        """
+        data = self._post_invitation(_dumps(self.build_payload(
+            server_ids, expires_in_days, duration, unlimited, library_ids,
+            allow_downloads, allow_live_tv, allow_mobile_uploads
+        )))
+        if not url_only:
+            return data
+        # Reduce the response to just its URL
+        url = _invitation_url(data)
+        return {} if url is None else {"invitation": {"url": url}}
+    
+    def create_invitations_bulk(
+        self,
+        count: int,
+        server_ids: List[int],
+        expires_in_days: Optional[int] = None,
+        duration: str = "unlimited",
+        unlimited: bool = True,
+        library_ids: Optional[List[int]] = None,
+        allow_downloads: bool = False,
+        allow_live_tv: bool = False,
+        allow_mobile_uploads: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Create several identical invitations with a single request.
+        
+        Uses the ``/api/invitations/batch`` endpoint, which not every Wizarr
+        server provides. The batch methods try it first and fall back to one
+        request per invitation when it is missing.
+        
+        Args:
+            count: Number of invitations to create
+            server_ids: Array of server IDs (required)
+            expires_in_days: Days until invitation expires (1, 7, 30, or None)
+            duration: User access duration in days or "unlimited"
+            unlimited: Whether user access is unlimited
+            library_ids: Array of library IDs to grant access to
+            allow_downloads: Allow user downloads
+            allow_live_tv: Allow live TV access
+            allow_mobile_uploads: Allow mobile uploads
+            
+        Returns:
+            List of created invitation dictionaries
+            
+        Raises:
+            requests.exceptions.RequestException: If the API request fails
+        """
+        url = f"{self.base_url}/api/invitations/batch"
+        
+        payload = self.build_payload(
+            server_ids, expires_in_days, duration, unlimited, library_ids,
+            allow_downloads, allow_live_tv, allow_mobile_uploads
+        )
+        payload["count"] = count
+        
         response = self.session.post(url, json=payload)
         response.raise_for_status()
         
-        return response.json()
+        return _bulk_invitations(_loads(response.content))
     
     def create_invitations_batch(
         self,
@@ -111,10 +490,17 @@ class WizarrClient:
         allow_downloads: bool = False,
         allow_live_tv: bool = False,
         allow_mobile_uploads: bool = False,
-        stop_on_error: bool = False
-    ) -> List[Dict[str, Any]]:
+        stop_on_error: bool = False,
+        url_only: bool = False,
+        on_result: Optional[Callable[[InviteResult], None]] = None,
+        progress_interval: int = 50
+    ) -> Dict[str, Any]:
         """Create multiple invitations in batch.
         
+        The bulk endpoint is tried first when creating more than one
+        invitation. Otherwise requests are spread over the client's worker
+        threads, which share its session; results are ordered by index.
+        
         Args:
             count: Number of invitations to create
             server_ids: Array of server IDs (required)
@@ -126,16 +512,31 @@ class WizarrClient:
             allow_live_tv: Allow live TV access
             allow_mobile_uploads: Allow mobile uploads
             stop_on_error: If True, stop batch creation on first error
+            url_only: Keep only each invitation's URL instead of the full
+                response
+            on_result: Called with each successful result as it completes;
+                when given, results are not collected in the return value
+            progress_interval: Log progress every this many completed
+                invitations (and on the last one)
             
         Returns:
-            List of dictionaries containing invitation responses
+            Dictionary with InviteResult results, error dictionaries
+            and summary counts
+        
+        Raises:
+            ValueError: If progress_interval is less than 1
         """
-        results = []
-        errors = []
+        from concurrent.futures import FIRST_COMPLETED, wait
+        from itertools import islice
+        import requests
         
-        for i in range(count):
+        if progress_interval < 1:
+            raise ValueError("progress_interval must be at least 1")
+        
+        if count > 1 and self._bulk_supported is not False:
             try:
-                result = self.create_invitation(
+                invitations = self.create_invitations_bulk(
+                    count=count,
                     server_ids=server_ids,
                     expires_in_days=expires_in_days,
                     duration=duration,
@@ -145,35 +546,353 @@ class WizarrClient:
                     allow_live_tv=allow_live_tv,
                     allow_mobile_uploads=allow_mobile_uploads
                 )
-                results.append({
-                    "success": True,
-                    "index": i + 1,
-                    "data": result
-                })
-                print(f"✓ Created invitation {i + 1}/{count}", file=sys.stderr)
-            except requests.exceptions.RequestException as e:
+            except (requests.exceptions.RequestException, ValueError) as e:
+                if not _bulk_fallback(e):
+                    return _failed_summary(count, e)
+                if _bulk_unsupported(e):
+                    self._bulk_supported = False
+                logger.info("Bulk request failed (%s); creating invitations one by one", e)
+            else:
+                self._bulk_supported = True
+                return _bulk_summary(count, invitations, url_only, on_result)
+        
+        # The payload is identical for every invitation, so serialize it once
+        payload_bytes = _dumps(self.build_payload(
+            server_ids, expires_in_days, duration, unlimited, library_ids,
+            allow_downloads, allow_live_tv, allow_mobile_uploads
+        ))
+        
+        # Each result lands in its index's slot, so they come out in order
+        # without sorting; nothing is kept when streaming to on_result
+        slots: List[Optional[InviteResult]] = [None] * count if on_result is None else []
+        errors = []
+        successful = 0
+        
+        def create(index):
+            # Reduced to an InviteResult on the worker, so with url_only the
+            # full response is dropped as soon as it is decoded
+            return InviteResult.from_response(
+                index, self._post_invitation(payload_bytes), url_only
+            )
+        
+        # Futures in flight, mapped to their index. Only a window of twice
+        # the worker count is submitted at a time and each future is dropped
+        # once recorded, so a streamed batch does not hold every response.
+        futures = {}
+        indexes = iter(range(1, count + 1))
+        window = 2 * self._max_workers
+        
+        def submit():
+            # Each worker blocks on network I/O, so the requests overlap
+            for index in islice(indexes, window - len(futures)):
+                futures[self._executor.submit(create, index)] = index
+        
+        def record(future):
+            """Record a finished request; return whether it failed."""
+            nonlocal successful
+            index = futures.pop(future)
+            try:
+                result = future.result()
+            except (requests.exceptions.RequestException, ValueError) as e:
+                # ValueError covers a response body that is not valid JSON
                 error_info = {
                     "success": False,
-                    "index": i + 1,
+                    "index": index,
                     "error": str(e)
                 }
                 errors.append(error_info)
-                print(f"✗ Failed to create invitation {i + 1}/{count}: {e}", file=sys.stderr)
-                
-                if stop_on_error:
+                logger.warning("✗ Failed to create invitation %d/%d: %s", index, count, e)
+                failed = True
+            else:
+                successful += 1
+                if on_result is None:
+                    slots[index - 1] = result
+                else:
+                    on_result(result)
+                failed = False
+            
+            completed = successful + len(errors)
+            if completed % progress_interval == 0 or completed == count:
+                logger.info("✓ Created %d/%d invitation(s)", successful, count)
+            return failed
+        
+        try:
+            submit()
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                failed = False
+                for future in done:
+                    failed = record(future) or failed
+                if failed and stop_on_error:
+                    # Drop queued requests and let the running ones finish,
+                    # so nothing from this batch outlives the call; those
+                    # may have created invitations, so record them as well
+                    for future in futures:
+                        future.cancel()
+                    wait(futures)
+                    for future in list(futures):
+                        if future.cancelled():
+                            del futures[future]
+                        else:
+                            record(future)
                     break
+                submit()
+        finally:
+            # Drop whatever is still queued if the loop ended early (an
+            # interrupt or an error from on_result), so those invitations
+            # are not created after nobody is left to record them
+            for future in futures:
+                future.cancel()
         
-        return {
-            "results": results,
-            "errors": errors,
-            "total": count,
-            "successful": len(results),
-            "failed": len(errors)
-        }
+        results = [result for result in slots if result is not None]
+        errors.sort(key=lambda e: e["index"])
+        
+        return _batch_summary(count, results, errors, successful)
+    
+    async def _post_json_aiohttp(
+        self,
+        session: Any,
+        path: str,
+        body: bytes
+    ) -> Any:
+        """POST a JSON body on an aiohttp session and decode the reply.
+        
+        Args:
+            session: aiohttp.ClientSession carrying the authentication headers
+            path: API path relative to the base URL
+            body: Serialized JSON request body
+        
+        Returns:
+            Decoded JSON response
+        
+        Raises:
+            aiohttp.ClientError: If the request fails
+            ValueError: If the response body is not valid JSON
+        """
+        async with session.post(f"{self.base_url}{path}", data=body) as response:
+            response.raise_for_status()
+            return _loads(await response.read())
+    
+    async def _post_json_httpx(
+        self,
+        session: Any,
+        path: str,
+        body: bytes
+    ) -> Any:
+        """POST a JSON body on an httpx client and decode the reply.
+        
+        Args:
+            session: httpx.AsyncClient carrying the authentication headers
+            path: API path relative to the base URL
+            body: Serialized JSON request body
+        
+        Returns:
+            Decoded JSON response
+        
+        Raises:
+            httpx.HTTPError: If the request fails
+            ValueError: If the response body is not valid JSON
+        """
+        response = await session.post(f"{self.base_url}{path}", content=body)
+        response.raise_for_status()
+        return _loads(response.content)
+    
+    async def create_invitations_batch_async(
+        self,
+        count: int,
+        server_ids: List[int],
+        expires_in_days: Optional[int] = None,
+        duration: str = "unlimited",
+        unlimited: bool = True,
+        library_ids: Optional[List[int]] = None,
+        allow_downloads: bool = False,
+        allow_live_tv: bool = False,
+        allow_mobile_uploads: bool = False,
+        stop_on_error: bool = False,
+        url_only: bool = False,
+        on_result: Optional[Callable[[InviteResult], None]] = None,
+        progress_interval: int = 50,
+        transport: str = "aiohttp",
+        concurrency: int = 16
+    ) -> Dict[str, Any]:
+        """Create multiple invitations concurrently.
+        
+        Up to ``concurrency`` requests are kept in flight over a shared
+        async session, overlapping their round-trips without flooding the
+        server or its rate limits. As in create_invitations_batch, the bulk
+        endpoint is tried first. Takes the same arguments and returns the
+        same structure as create_invitations_batch, with results ordered by
+        index.
+        
+        The "httpx" transport speaks HTTP/2 where the server supports it,
+        multiplexing the whole batch over a single connection. It requires
+        the optional ``httpx[http2]`` package.
+        
+        Args:
+            count: Number of invitations to create
+            server_ids: Array of server IDs (required)
+            expires_in_days: Days until invitation expires (1, 7, 30, or None)
+            duration: User access duration in days or "unlimited"
+            unlimited: Whether user access is unlimited
+            library_ids: Array of library IDs to grant access to
+            allow_downloads: Allow user downloads
+            allow_live_tv: Allow live TV access
+            allow_mobile_uploads: Allow mobile uploads
+            stop_on_error: If True, send no further requests after the first error
+            url_only: Keep only each invitation's URL instead of the full
+                response
+            on_result: Called with each successful result as it completes;
+                when given, results are not collected in the return value
+            progress_interval: Log progress every this many completed
+                invitations (and on the last one)
+            transport: HTTP library to use, "aiohttp" or "httpx"
+            concurrency: Maximum number of requests in flight at once
+            
+        Returns:
+            Dictionary with InviteResult results, error dictionaries
+            and summary counts
+        
+        Raises:
+            ValueError: If progress_interval is less than 1
+        """
+        import asyncio
+        
+        if progress_interval < 1:
+            raise ValueError("progress_interval must be at least 1")
+        
+        # The payload is identical for every invitation, so serialize it once
+        payload = self.build_payload(
+            server_ids, expires_in_days, duration, unlimited, library_ids,
+            allow_downloads, allow_live_tv, allow_mobile_uploads
+        )
+        body = _dumps(payload)
+        
+        headers = {'Content-Type': 'application/json'}
+        if self.api_key:
+            headers['X-API-Key'] = self.api_key
+        
+        # Each result lands in its index's slot, so they come out in order
+        # without sorting; nothing is kept when streaming to on_result
+        slots: List[Optional[InviteResult]] = [None] * count if on_result is None else []
+        errors = []
+        successful = 0
+        
+        if transport == "aiohttp":
+            import aiohttp
+            session = aiohttp.ClientSession(
+                headers=headers,
+                connector=aiohttp.TCPConnector(limit=concurrency)
+            )
+            request_errors = (aiohttp.ClientError, asyncio.TimeoutError, ValueError)
+            post = self._post_json_aiohttp
+        elif transport == "httpx":
+            try:
+                import httpx
+            except ImportError:
+                raise ImportError(
+                    'The httpx transport requires: pip install "httpx[http2]"'
+                ) from None
+            session = httpx.AsyncClient(
+                headers=headers,
+                transport=httpx.AsyncHTTPTransport(
+                    http2=True,
+                    limits=httpx.Limits(
+                        max_connections=concurrency,
+                        max_keepalive_connections=concurrency
+                    ),
+                    retries=3
+                )
+            )
+            request_errors = (httpx.HTTPError, ValueError)
+            post = self._post_json_httpx
+        else:
+            raise ValueError(f"Unknown transport: {transport!r}")
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async with session:
+            if count > 1 and self._bulk_supported is not False:
+                try:
+                    invitations = _bulk_invitations(await post(
+                        session, "/api/invitations/batch", _dumps(dict(payload, count=count))
+                    ))
+                except request_errors as e:
+                    if not _bulk_fallback(e):
+                        return _failed_summary(count, e)
+                    if _bulk_unsupported(e):
+                        self._bulk_supported = False
+                    logger.info("Bulk request failed (%s); creating invitations one by one", e)
+                else:
+                    self._bulk_supported = True
+                    return _bulk_summary(count, invitations, url_only, on_result)
+            
+            # Set on stop_on_error; requests not yet sent are then skipped
+            stopped = False
+            
+            async def create(index, post):
+                async with semaphore:
+                    if stopped:
+                        return None
+                    try:
+                        data = await post(session, "/api/invitations", body)
+                    except request_errors as e:
+                        return index, None, e
+                    return index, InviteResult.from_response(index, data, url_only), None
+            
+            recorded = set()
+            
+            def record(outcome):
+                """Record a finished request; return whether it failed."""
+                nonlocal successful
+                index, result, error = outcome
+                recorded.add(index)
+                if error is None:
+                    successful += 1
+                    if on_result is None:
+                        slots[index - 1] = result
+                    else:
+                        on_result(result)
+                else:
+                    errors.append({
+                        "success": False,
+                        "index": index,
+                        "error": str(error)
+                    })
+                    logger.warning("✗ Failed to create invitation %d/%d: %s", index, count, error)
+                
+                completed = successful + len(errors)
+                if completed % progress_interval == 0 or completed == count:
+                    logger.info("✓ Created %d/%d invitation(s)", successful, count)
+                return error is not None
+            
+            tasks = [asyncio.ensure_future(create(i + 1, post)) for i in range(count)]
+            try:
+                for future in asyncio.as_completed(tasks):
+                    if record(await future) and stop_on_error:
+                        # Send nothing new, but let the requests in flight
+                        # finish: they may have created invitations, so
+                        # record them as the threaded batch does
+                        stopped = True
+                        for outcome in await asyncio.gather(*tasks):
+                            if outcome is not None and outcome[0] not in recorded:
+                                record(outcome)
+                        break
+            finally:
+                # Cancel whatever is still in flight on an interrupt
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+        
+        results = [result for result in slots if result is not None]
+        errors.sort(key=lambda e: e["index"])
+        
+        return _batch_summary(count, results, errors, successful)
 
 
 def main():
     """Main CLI entry point."""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Wizarr API Client - Batch invitation creation tool",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -271,6 +990,27 @@ Examples:
         action='store_true',
         help='Stop batch creation on first error'
     )
+    parser.add_argument(
+        '--no-bulk',
+        action='store_false',
+        dest='bulk',
+        help='Skip trying the bulk endpoint, saving a round trip on servers '
+             'without it'
+    )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        help='Maximum number of requests in flight at once; 1 creates '
+             'invitations one at a time (default: 1 for fewer than 8 '
+             'invitations, otherwise up to 32)'
+    )
+    parser.add_argument(
+        '--transport',
+        choices=['threads', 'aiohttp', 'httpx'],
+        help='How to run concurrent requests: a thread pool, aiohttp, or '
+             'httpx over HTTP/2 (default: threads, the only transport that '
+             'retries throttled and failed requests)'
+    )
     
     # Output options
     parser.add_argument(
@@ -287,93 +1027,167 @@ Examples:
         action='store_true',
         help='Output detailed JSON results instead of just invitation URLs'
     )
+    parser.add_argument(
+        '--output-format',
+        choices=['ndjson', 'json'],
+        default='ndjson',
+        help='Format of --verbose output: one JSON object per line, written '
+             'as invitations are created, or a single JSON document '
+             '(default: ndjson)'
+    )
     
     args = parser.parse_args()
     
-    # Load config from file if provided
+    # Load config from file if provided. Its invitation settings become the
+    # parser's defaults, so any option given on the command line still wins.
     if args.config:
-        with open(args.config, 'r') as f:
-            config = json.load(f)
-        
-        # Override with command-line args if provided
-        count = args.count or config.get('count', 1)
-        server_ids = args.server_ids or config.get('server_ids')
-        expires_in_days = args.expires_in_days if args.expires_in_days is not None else config.get('expires_in_days')
-        duration = args.duration if args.duration != 'unlimited' else config.get('duration', 'unlimited')
-        unlimited = args.unlimited if 'unlimited' in vars(args) else config.get('unlimited', True)
-        library_ids = args.library_ids or config.get('library_ids')
-        allow_downloads = args.allow_downloads or config.get('allow_downloads', False)
-        allow_live_tv = args.allow_live_tv or config.get('allow_live_tv', False)
-        allow_mobile_uploads = args.allow_mobile_uploads or config.get('allow_mobile_uploads', False)
-    else:
-        if not args.count:
-            parser.error("--count is required when --config is not used")
-        if not args.server_ids:
-            parser.error("--server-ids is required")
-        
-        count = args.count
-        server_ids = args.server_ids
-        expires_in_days = args.expires_in_days
-        duration = args.duration
-        unlimited = args.unlimited
-        library_ids = args.library_ids
-        allow_downloads = args.allow_downloads
-        allow_live_tv = args.allow_live_tv
-        allow_mobile_uploads = args.allow_mobile_uploads
-    
-    # Create client
-    client = WizarrClient(base_url=args.base_url, api_key=args.api_key)
+        with open(args.config, 'rb') as f:
+            config = _loads(f.read())
+        defaults = {'count': 1}
+        for key in CONFIG_KEYS:
+            if key in config:
+                defaults[key] = config[key]
+        for action in parser._actions:
+            value = defaults.get(action.dest)
+            if action.choices is not None and value is not None and value not in action.choices:
+                parser.error(
+                    f"invalid {action.dest} in {args.config}: {value!r} "
+                    f"(choose from {', '.join(map(repr, action.choices))})"
+                )
+        parser.set_defaults(**defaults)
+        args = parser.parse_args()
+    
+    if not args.count:
+        parser.error("--count is required when --config is not used")
+    if not args.server_ids:
+        parser.error("--server-ids is required")
+    if args.concurrency is not None and args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    if args.transport == 'httpx':
+        from importlib.util import find_spec
+        if find_spec('httpx') is None or find_spec('h2') is None:
+            parser.error('--transport httpx requires: pip install "httpx[http2]"')
+    
+    # Small batches stay sequential by default: opening extra connections
+    # costs more than it saves there
+    concurrency = args.concurrency
+    if concurrency is None:
+        concurrency = min(args.count, 32) if args.transport or args.count >= 8 else 1
+    # Threads stay the default because only the requests session retries
+    # 429 and 5xx responses; the async transports would fail them outright
+    transport = args.transport or 'threads'
+    
+    # Large batches are written out record by record as they are created
+    # instead of holding the whole batch in memory
+    json_document = args.verbose and args.output_format == 'json'
+    stream = not json_document and args.count > STREAM_THRESHOLD
+    out_file = None
+    written = 0
+    
+    def format_record(res):
+        if args.verbose:
+            return _dumps(res.to_dict())
+        if res.url:
+            return res.url.encode('utf-8')
+        return None
+    
+    def write_record(res):
+        nonlocal written
+        line = format_record(res)
+        if line is not None:
+            out_file.write(line + b'\n')
+            out_file.flush()
+            written += 1
+    
+    if stream:
+        out_file = open(args.output, 'wb') if args.output else sys.stdout.buffer
+    
+    # Progress goes to stderr; --quiet keeps only warnings and errors. The
+    # handler is added once per process and records stop there, so neither
+    # a second call nor a root handler prints every line twice.
+    if not logger.handlers:
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        logger.addHandler(handler)
+        logger.propagate = False
+    logger.setLevel(logging.WARNING if args.quiet else logging.INFO)
     
     # Create invitations
-    if not args.quiet:
-        print(f"Creating {count} invitation(s)...", file=sys.stderr)
-    
-    result = client.create_invitations_batch(
-        count=count,
-        server_ids=server_ids,
-        expires_in_days=expires_in_days,
-        duration=duration,
-        unlimited=unlimited,
-        library_ids=library_ids,
-        allow_downloads=allow_downloads,
-        allow_live_tv=allow_live_tv,
-        allow_mobile_uploads=allow_mobile_uploads,
-        stop_on_error=args.stop_on_error
+    logger.info("Creating %d invitation(s)...", args.count)
+    
+    batch_options = dict(
+        count=args.count,
+        server_ids=args.server_ids,
+        expires_in_days=args.expires_in_days,
+        duration=args.duration,
+        unlimited=args.unlimited,
+        library_ids=args.library_ids,
+        allow_downloads=args.allow_downloads,
+        allow_live_tv=args.allow_live_tv,
+        allow_mobile_uploads=args.allow_mobile_uploads,
+        stop_on_error=args.stop_on_error,
+        url_only=not args.verbose,
+        on_result=write_record if stream else None
     )
     
+    try:
+        with WizarrClient(
+            base_url=args.base_url,
+            api_key=args.api_key,
+            pool_maxsize=max(50, concurrency),
+            max_workers=concurrency,
+            try_bulk=args.bulk
+        ) as client:
+            if transport == 'threads':
+                result = client.create_invitations_batch(**batch_options)
+            else:
+                result = _run_async(client.create_invitations_batch_async(
+                    transport=transport,
+                    concurrency=concurrency,
+                    **batch_options
+                ))
+        
+        if stream and args.verbose:
+            for error in result['errors']:
+                out_file.write(_dumps(error) + b'\n')
+    finally:
+        if args.output and out_file is not None:
+            out_file.close()
+    
     # Output results
-    if args.verbose:
+    if json_document:
         # Output full JSON structure
-        output = json.dumps(result, indent=2)
+        import json
+        output = json.dumps(
+            dict(result, results=[res.to_dict() for res in result['results']]),
+            indent=2
+        )
         
         if args.output:
             with open(args.output, 'w') as f:
                 f.write(output)
-            if not args.quiet:
-                print(f"\nResults saved to {args.output}", file=sys.stderr)
         else:
             print(output)
-    else:
-        # Output only invitation URLs (one per line)
-        urls = []
-        for res in result['results']:
-            if res['success'] and 'invitation' in res['data']:
-                invitation = res['data']['invitation']
-                if 'url' in invitation:
-                    urls.append(invitation['url'])
-        
-        output = '\n'.join(urls)
+    elif not stream:
+        # Join everything into one buffer and hand it over in a single write
+        lines = [line for line in map(format_record, result['results']) if line is not None]
+        written = len(lines)
+        if args.verbose:
+            lines.extend(_dumps(error) for error in result['errors'])
+        data = b'\n'.join(lines) + b'\n' if lines else b''
         
         if args.output:
-            with open(args.output, 'w') as f:
-                f.write(output)
-                if urls:
-                    f.write('\n')  # Add trailing newline
-            if not args.quiet:
-                print(f"\n{len(urls)} invitation URL(s) saved to {args.output}", file=sys.stderr)
+            with open(args.output, 'wb') as f:
+                f.write(data)
+        else:
+            sys.stdout.buffer.write(data)
+            sys.stdout.buffer.flush()
+    
+    if args.output:
+        if args.verbose:
+            logger.info("\nResults saved to %s", args.output)
         else:
-            if urls:
-                print(output)
+            logger.info("\n%d invitation URL(s) saved to %s", written, args.output)
     
     # Exit with error code if any failures
     if result['failed'] > 0: